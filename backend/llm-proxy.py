@@ -7,16 +7,29 @@ Designed for Google Cloud Run deployment
 
 from __future__ import annotations
 
+import argparse
+import bisect
+import cProfile
 import csv
+import functools
+import heapq
+import hmac
 import json
+import multiprocessing
 import os
+import re
+import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, send_from_directory
 from flask_cors import CORS
 from groq import Groq
 from sentence_transformers import SentenceTransformer
@@ -38,6 +51,33 @@ PORT = int(os.environ.get("PORT", 8080))  # Cloud Run compatibility
 # Vector search weights
 VECTOR_WEIGHT = 0.7
 KEYWORD_WEIGHT = 0.3
+VECTOR_CANDIDATES = 50  # Vector hits fetched per query before reranking
+
+# Typeahead (autocomplete) settings
+AUTOCOMPLETE_LIMIT = 10
+AUTOCOMPLETE_MAX_LIMIT = 50
+AUTOCOMPLETE_SHORT_PREFIX = 2  # Prefixes up to this length are precomputed
+AUTOCOMPLETE_FUZZY_MIN_LEN = 3  # Shorter queries only match exactly
+
+# Schedule planner settings
+WEEK_DAYS = "MTWRFSU"
+MINUTES_PER_DAY = 24 * 60  # Planner masks have one bit per minute
+PLANNER_COURSES = 4  # Courses per plan
+PLANNER_MAX_COURSES = 8
+PLANNER_PLANS = 5  # Plans returned
+PLANNER_MAX_PLANS = 20
+PLANNER_CANDIDATES = 40  # Search results considered
+PLANNER_TIME_BUDGET = 0.2  # Seconds of branch-and-bound before returning best so far
+
+# On-demand profiling (off unless PROFILING_ENABLED and PROFILE_ADMIN_TOKEN are set)
+PROFILE_ADMIN_TOKEN = os.environ.get("PROFILE_ADMIN_TOKEN")  # Required for trigger + admin routes
+PROFILING_ENABLED = os.environ.get("PROFILING_ENABLED", "").lower() in ("1", "true", "yes")
+PROFILE_DIR = Path(os.environ.get("PROFILE_DIR", Path(tempfile.gettempdir()) / "course-pilot-profiles"))
+PROFILE_MAX_FILES = int(os.environ.get("PROFILE_MAX_FILES", 20))
+
+if PROFILING_ENABLED and not PROFILE_ADMIN_TOKEN:
+    print("⚠️  PROFILING_ENABLED is set but PROFILE_ADMIN_TOKEN is not. Profiling disabled.")
+    PROFILING_ENABLED = False
 
 # ---------------------------------------------------------------------
 # Initialize Vector Database (ChromaDB)
@@ -201,6 +241,23 @@ def init_groq():
 # Course Data Loading (for metadata and filtering)
 # ---------------------------------------------------------------------
 
+def to_mins(t_str: str) -> int:
+    """Convert "9:30 AM" to minutes since midnight (-1 if unparseable)."""
+    try:
+        parts = t_str.strip().upper().replace(".", "").split()
+        if len(parts) != 2:
+            return -1
+        time_part, period = parts
+        h, m = map(int, time_part.split(":"))
+        if period == "PM" and h != 12:
+            h += 12
+        if period == "AM" and h == 12:
+            h = 0
+        return h * 60 + m
+    except:
+        return -1
+
+
 def parse_time_slots(start_str: str, end_str: str) -> List[str]:
     """Convert start/end times into 30-min slots."""
     if not start_str or not end_str:
@@ -209,21 +266,6 @@ def parse_time_slots(start_str: str, end_str: str) -> List[str]:
     start_str = start_str.strip().upper()
     end_str = end_str.strip().upper()
     
-    def to_mins(t_str):
-        try:
-            parts = t_str.replace(".", "").split()
-            if len(parts) != 2:
-                return -1
-            time_part, period = parts
-            h, m = map(int, time_part.split(":"))
-            if period == "PM" and h != 12:
-                h += 12
-            if period == "AM" and h == 12:
-                h = 0
-            return h * 60 + m
-        except:
-            return -1
-    
     start_mins = to_mins(start_str)
     end_mins = to_mins(end_str)
     
@@ -251,6 +293,36 @@ def parse_time_slots(start_str: str, end_str: str) -> List[str]:
     return slots
 
 
+def schedule_mask(days: List[str], start_str: str, end_str: str) -> int:
+    """
+    Encode a meeting pattern as a bitmask with one bit per (day, minute) the
+    class occupies, [start, end). Times are whole minutes, so two courses
+    overlap iff their masks share a bit; 0 means TBA.
+    
+    >>> early = schedule_mask(["M"], "9:20 AM", "10:10 AM")
+    >>> bool(early & schedule_mask(["M"], "10:00 AM", "10:30 AM"))
+    True
+    >>> bool(early & schedule_mask(["M"], "10:10 AM", "11:00 AM"))
+    False
+    >>> bool(schedule_mask(["M"], "9:00 AM", "9:20 AM") & schedule_mask(["M"], "9:25 AM", "9:50 AM"))
+    False
+    >>> schedule_mask(["M"], "TBA", "")
+    0
+    """
+    start_mins = to_mins(start_str or "")
+    end_mins = to_mins(end_str or "")
+    if start_mins < 0 or end_mins <= start_mins:
+        return 0
+    
+    meeting = ((1 << (end_mins - start_mins)) - 1) << start_mins
+    mask = 0
+    for day in days:
+        day_idx = WEEK_DAYS.find(day)
+        if day_idx >= 0:
+            mask |= meeting << (day_idx * MINUTES_PER_DAY)
+    return mask
+
+
 def parse_days(weekday_str: str) -> List[str]:
     """Convert 'MWF' -> ['M', 'W', 'F']"""
     if not weekday_str or weekday_str == "TBA":
@@ -406,6 +478,342 @@ REVIEWS_MAP, WORKLOAD_HOURS_MAP, RATINGS_MAP = load_reviews()
 # Create course lookup by ID
 COURSES_BY_ID = {str(c.get("course_id", "")): c for c in COURSES}
 
+# Meeting-time bitmasks for the schedule planner (0 = TBA)
+COURSE_SLOT_MASKS = {
+    cid: schedule_mask(c.get("_days", []), c.get("start", ""), c.get("end", ""))
+    for cid, c in COURSES_BY_ID.items()
+}
+
+# ---------------------------------------------------------------------
+# Typeahead Index (prefix lookup, no embeddings)
+# ---------------------------------------------------------------------
+
+def normalize_lookup_key(text: str) -> str:
+    """Lowercase and keep only letters/digits ("15-112" -> "15112")."""
+    return re.sub(r"[^0-9a-z]+", "", str(text).lower())
+
+
+def word_suffix_keys(text: str) -> List[str]:
+    """
+    Normalized keys starting at every word of a phrase, so a title can be
+    found by any of its words ("Machine Learning" -> machinelearning, learning).
+    """
+    words = [w for w in re.split(r"[^0-9a-z]+", str(text).lower()) if w]
+    return ["".join(words[i:]) for i in range(len(words))]
+
+
+def build_autocomplete_index(courses_by_id: Dict[str, Dict[str, Any]],
+                             reviews_map: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Build a sorted-array prefix index over course IDs, titles and tags.
+
+    Every (key, course_id) pair is kept in one sorted list so a prefix lookup
+    is two bisects. Results for 1-2 character prefixes, which would otherwise
+    cover large slices of the list, are ranked ahead of time.
+    """
+    review_counts = {cid: len(reviews_map.get(cid, [])) for cid in courses_by_id}
+    
+    pairs = set()
+    for cid, course in courses_by_id.items():
+        keys = set(word_suffix_keys(course.get("course_name", "")))
+        for tag in course.get("tags", []):
+            keys.update(word_suffix_keys(tag))
+        id_key = normalize_lookup_key(cid)
+        if id_key:
+            keys.add(id_key)
+        for key in keys:
+            pairs.add((key, cid))
+    
+    pairs = sorted(pairs)
+    keys = [key for key, _ in pairs]
+    course_ids = [cid for _, cid in pairs]
+    
+    def rank(cid: str) -> Tuple[int, str]:
+        return (-review_counts[cid], cid)
+    
+    short_prefixes: Dict[str, Set[str]] = {}
+    for key, cid in pairs:
+        for n in range(1, min(len(key), AUTOCOMPLETE_SHORT_PREFIX) + 1):
+            short_prefixes.setdefault(key[:n], set()).add(cid)
+    
+    return {
+        "keys": keys,
+        "course_ids": course_ids,
+        "review_counts": review_counts,
+        "short": {
+            prefix: sorted(cids, key=rank)[:AUTOCOMPLETE_MAX_LIMIT]
+            for prefix, cids in short_prefixes.items()
+        },
+        "alphabet": "".join(sorted({ch for key in keys for ch in key})),
+    }
+
+
+def prefix_matches(index: Dict[str, Any], prefix: str) -> List[str]:
+    """Return course IDs with any indexed key starting with prefix."""
+    keys = index["keys"]
+    lo = bisect.bisect_left(keys, prefix)
+    if lo == len(keys) or not keys[lo].startswith(prefix):
+        return []
+    hi = bisect.bisect_left(keys, prefix + "\x7f", lo)
+    return index["course_ids"][lo:hi]
+
+
+def longest_indexed_prefix(index: Dict[str, Any], query: str) -> int:
+    """Length of the longest prefix of query that some indexed key starts with."""
+    lo, hi = 0, len(query)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if prefix_matches(index, query[:mid]):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def one_edit_variants(query: str, alphabet: str, max_pos: int) -> Set[str]:
+    """
+    All strings one insertion, deletion, substitution or swap away from query,
+    editing only at positions <= max_pos (later edits keep an unindexed prefix).
+    """
+    variants = set()
+    for i in range(min(len(query), max_pos + 1)):
+        variants.add(query[:i] + query[i + 1:])
+        if i + 1 < len(query):
+            variants.add(query[:i] + query[i + 1] + query[i] + query[i + 2:])
+        for ch in alphabet:
+            variants.add(query[:i] + ch + query[i:])
+            variants.add(query[:i] + ch + query[i + 1:])
+    variants.discard(query)
+    return variants
+
+
+def autocomplete_courses(query: str, limit: int = AUTOCOMPLETE_LIMIT) -> List[Dict[str, Any]]:
+    """
+    Typeahead lookup ranked by review count.
+    
+    Exact prefix matches come first; if they don't fill the limit, prefixes
+    within one edit of the query are added (queries of 3+ characters).
+    """
+    key = normalize_lookup_key(query)
+    if not key:
+        return []
+    
+    index = AUTOCOMPLETE_INDEX
+    review_counts = index["review_counts"]
+    
+    if len(key) <= AUTOCOMPLETE_SHORT_PREFIX:
+        ranked = index["short"].get(key, [])[:limit]
+        fuzzy = set()
+    else:
+        exact = set(prefix_matches(index, key))
+        fuzzy = set()
+        if len(exact) < limit and len(key) >= AUTOCOMPLETE_FUZZY_MIN_LEN:
+            max_pos = longest_indexed_prefix(index, key)
+            for variant in one_edit_variants(key, index["alphabet"], max_pos):
+                if len(variant) >= AUTOCOMPLETE_FUZZY_MIN_LEN:
+                    fuzzy.update(prefix_matches(index, variant))
+            fuzzy -= exact
+        
+        ranked = sorted(
+            exact | fuzzy,
+            key=lambda cid: (cid in fuzzy, -review_counts[cid], cid)
+        )[:limit]
+    
+    results = []
+    for cid in ranked:
+        course = COURSES_BY_ID[cid]
+        results.append({
+            "course_id": cid,
+            "course_name": course.get("course_name", ""),
+            "industry": course.get("industry", ""),
+            "rating": RATINGS_MAP.get(cid, 4.5),
+            "review_count": review_counts[cid],
+            "fuzzy": cid in fuzzy,
+        })
+    return results
+
+
+AUTOCOMPLETE_INDEX = build_autocomplete_index(COURSES_BY_ID, REVIEWS_MAP)
+print(f"✓ Built autocomplete index with {len(AUTOCOMPLETE_INDEX['keys'])} keys")
+
+# ---------------------------------------------------------------------
+# Course Card Fragments (pre-serialized match results)
+# ---------------------------------------------------------------------
+
+# Compact separators, as used by jsonify() when the app isn't in debug mode
+JSON_SEPARATORS = (",", ":")
+
+
+def workload_label_for(course_id: str) -> str:
+    """Bucket average weekly hours from reviews into a workload label."""
+    avg_hours = WORKLOAD_HOURS_MAP.get(str(course_id), 0)
+    if avg_hours == 0:
+        return "Unknown"
+    elif avg_hours <= 7:
+        return "Light Workload"
+    elif avg_hours <= 11:
+        return "Medium Workload"
+    return "Heavy Workload"
+
+
+def match_percent_for(score: float) -> int:
+    """Clamp a hybrid score to [0, 1] and express it as a whole percentage."""
+    return int(round(max(0.0, min(1.0, score)) * 100))
+
+
+def course_card(course: Dict[str, Any], match_percent: int) -> Dict[str, Any]:
+    """Course card as returned by /api/courses/match."""
+    cid = course.get("course_id", "")
+    
+    return {
+        "course_id": cid,
+        "course_name": course.get("course_name", "Untitled Course"),
+        "rating": RATINGS_MAP.get(str(cid), 4.5),
+        "match_percent": match_percent,
+        "workload_label": workload_label_for(cid),
+        "level": course.get("level", "unknown"),
+        "tags": course.get("tags", [])[:10],
+        "ai_summary": course.get("description_clean", "No description available."),
+        "reviews": REVIEWS_MAP.get(str(cid), []),
+        "industry": course.get("industry", ""),
+        "meetingTime": course.get("_meetingTime", ""),
+        "days": course.get("_days", []),
+        "times": course.get("_times", []),
+        "raw": course,
+    }
+
+
+def build_course_card_fragment(course: Dict[str, Any]) -> Tuple[bytes, bytes]:
+    """
+    Serialize everything in a course card except match_percent, split into
+    the bytes before and after its value, in the same key order and encoding
+    jsonify() would produce.
+    """
+    card = course_card(course, 0)
+    keys = sorted(card) if app.json.sort_keys else list(card)
+    split = keys.index("match_percent")
+    
+    before = app.json.dumps({k: card[k] for k in keys[:split]}, separators=JSON_SEPARATORS)[1:-1]
+    after = app.json.dumps({k: card[k] for k in keys[split + 1:]}, separators=JSON_SEPARATORS)[1:-1]
+    match_key = app.json.dumps("match_percent")
+    
+    prefix = "{" + (before + "," if before else "") + match_key + ":"
+    suffix = ("," + after if after else "") + "}"
+    return prefix.encode("utf-8"), suffix.encode("utf-8")
+
+
+def build_course_card_fragments(courses_by_id: Dict[str, Dict[str, Any]]) -> Dict[str, Tuple[bytes, bytes]]:
+    """Pre-serialize the static part of every course card (call again after reloading data)."""
+    return {cid: build_course_card_fragment(course) for cid, course in courses_by_id.items()}
+
+
+def match_response(results: List[Tuple[float, Dict[str, Any]]], debug: Dict[str, Any]) -> Response:
+    """
+    Build the /api/courses/match response by splicing each result's
+    match_percent between its pre-serialized card fragments. Byte-for-byte
+    identical to jsonify() of the full payload; falls back to it when the
+    app pretty-prints (debug mode).
+    """
+    if app.json.compact is False or (app.json.compact is None and app.debug):
+        return jsonify({
+            "courses": [course_card(course, match_percent_for(score)) for score, course in results],
+            "debug": debug,
+        })
+    
+    cards = []
+    for score, course in results:
+        cid = str(course.get("course_id", ""))
+        fragment = COURSE_CARD_FRAGMENTS.get(cid)
+        if fragment is None or COURSES_BY_ID.get(cid) is not course:
+            fragment = build_course_card_fragment(course)
+        prefix, suffix = fragment
+        cards.append(prefix + str(match_percent_for(score)).encode("ascii") + suffix)
+    
+    body = b"".join([
+        b'{"courses":[', b",".join(cards), b'],"debug":',
+        app.json.dumps(debug, separators=JSON_SEPARATORS).encode("utf-8"),
+        b"}\n",
+    ])
+    return app.response_class(body, mimetype=app.json.mimetype)
+
+
+COURSE_CARD_FRAGMENTS = build_course_card_fragments(COURSES_BY_ID)
+print(f"✓ Pre-serialized {len(COURSE_CARD_FRAGMENTS)} course cards")
+
+
+# ---------------------------------------------------------------------
+# Request Coalescing (single-flight)
+# ---------------------------------------------------------------------
+
+class InFlightCall:
+    """A computation in progress that other callers can wait on."""
+    __slots__ = ("done", "result", "error")
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key: the first caller runs the
+    function, callers arriving while it is running wait and get the same
+    result (or exception). Nothing is cached once the call finishes.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Any, InFlightCall] = {}
+        self._stats = {"calls": 0, "deduplicated": 0}
+    
+    def do(self, key: Any, fn, *args, **kwargs) -> Any:
+        with self._lock:
+            self._stats["calls"] += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self._stats["deduplicated"] += 1
+                is_leader = False
+            else:
+                call = self._calls[key] = InFlightCall()
+                is_leader = True
+        
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        except BaseException as e:
+            # Leader was interrupted (SystemExit, KeyboardInterrupt): waiters
+            # must not mistake the missing result for a None return value
+            call.error = RuntimeError(f"Coalesced call interrupted: {type(e).__name__}")
+            call.error.__cause__ = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, in_flight=len(self._calls))
+
+
+def normalize_text(text: Any) -> str:
+    """Lowercase and collapse whitespace, for coalescing keys."""
+    return " ".join(str(text or "").lower().split())
+
+
+SEARCH_FLIGHTS = SingleFlight()
+SUMMARY_FLIGHTS = SingleFlight()
+
 # ---------------------------------------------------------------------
 # Hybrid Search Implementation
 # ---------------------------------------------------------------------
@@ -429,7 +837,101 @@ def keyword_score(query: str, course_id: str) -> float:
     return 0.0
 
 
+def build_match_query(payload: Dict[str, Any]) -> str:
+    """Combine goal, skills and resume from a match request into one query string."""
+    goal = payload.get("goal", "")
+    skills = payload.get("skills", [])
+    resume = payload.get("resume", "")
+    
+    query_parts = [goal]
+    if isinstance(skills, list):
+        query_parts.extend(skills)
+    else:
+        query_parts.append(str(skills))
+    query_parts.append(resume)
+    
+    return " ".join(str(p) for p in query_parts if p).strip()
+
+
+def parse_user_schedule(schedule: List[Dict[str, Any]]) -> Dict[str, set]:
+    """Convert [{"day": "M", "times": [...]}, ...] into {"M": {...}}."""
+    user_schedule_map = {}
+    for item in schedule or []:
+        day = item.get("day")
+        times = item.get("times", [])
+        if day and times:
+            user_schedule_map[day] = set(times)
+    return user_schedule_map
+
+
+def is_schedule_compatible(course: Dict[str, Any], user_schedule: Dict[str, set]) -> bool:
+    """True if every meeting slot of the course falls inside the user's free time."""
+    course_days = course.get("_days", [])
+    course_times = course.get("_times", [])
+    
+    if not course_days or not course_times:
+        return False  # Skip TBA courses if user has schedule preference
+    
+    for day in course_days:
+        if day not in user_schedule:
+            return False
+        
+        user_times = user_schedule[day]
+        for t in course_times:
+            if t not in user_times:
+                return False
+    
+    return True
+
+
+def rank_candidates(query: str, candidates: List[Tuple[str, float]],
+                    user_schedule: Dict[str, set], top_k: int) -> List[Tuple[float, Dict[str, Any]]]:
+    """
+    Rerank vector-search candidates.
+    
+    candidates: (course_id, vector_similarity) pairs
+    Returns: top_k (hybrid score, course) tuples that fit the user's schedule
+    """
+    scored_courses = []
+    
+    for course_id, vector_score in candidates:
+        # Get keyword score using actual course_id
+        kw_score = keyword_score(query, course_id)
+        
+        # Hybrid score
+        final_score = (vector_score * VECTOR_WEIGHT) + (kw_score * KEYWORD_WEIGHT)
+        
+        # Get full course data using actual course_id
+        course = COURSES_BY_ID.get(course_id)
+        if not course:
+            continue
+        
+        # Apply schedule filtering
+        if user_schedule and not is_schedule_compatible(course, user_schedule):
+            continue
+        
+        scored_courses.append((final_score, course))
+    
+    # Sort by hybrid score
+    scored_courses.sort(key=lambda x: x[0], reverse=True)
+    
+    return scored_courses[:top_k]
+
+
 def hybrid_search(query: str, user_schedule: Dict[str, set], top_k: int = 20) -> List[Tuple[float, Dict[str, Any]]]:
+    """
+    Hybrid search, coalescing identical concurrent requests into one
+    embedding + ChromaDB query (see run_hybrid_search).
+    """
+    key = (
+        normalize_text(query),
+        frozenset((day, frozenset(times)) for day, times in user_schedule.items()),
+        top_k,
+    )
+    return SEARCH_FLIGHTS.do(key, run_hybrid_search, query, user_schedule, top_k)
+
+
+def run_hybrid_search(query: str, user_schedule: Dict[str, set], top_k: int = 20) -> List[Tuple[float, Dict[str, Any]]]:
     """
     Hybrid search combining:
     1. Vector similarity (70%)
@@ -443,61 +945,265 @@ def hybrid_search(query: str, user_schedule: Dict[str, set], top_k: int = 20) ->
     # Step 1: Vector search using ChromaDB
     results = course_collection.query(
         query_texts=[query],
-        n_results=min(50, course_collection.count())  # Get more candidates for reranking
+        n_results=min(VECTOR_CANDIDATES, course_collection.count())  # Get more candidates for reranking
     )
     
-    scored_courses = []
+    # Step 2: Rerank. ChromaDB IDs are row_X, so the course_id comes from
+    # metadata; distances are cosine distances, converted to similarity.
+    candidates = [
+        (metadata.get('course_id', ''), 1.0 - distance)
+        for metadata, distance in zip(results['metadatas'][0], results['distances'][0])
+    ]
     
+    return rank_candidates(query, candidates, user_schedule, top_k)
+
+
+# ---------------------------------------------------------------------
+# Schedule Planner
+# ---------------------------------------------------------------------
+
+def plan_schedules(candidates: List[Tuple[float, Dict[str, Any]]], n_courses: int,
+                   n_plans: int, time_budget: float = PLANNER_TIME_BUDGET) -> Tuple[List[Tuple[float, List[Tuple[float, Dict[str, Any]]]]], bool]:
+    """
+    Find the n_plans highest-scoring sets of n_courses candidates whose
+    meeting times don't overlap (TBA courses are left out).
     
-    for i, row_id in enumerate(results['ids'][0]):
-        # Get the actual course_id from metadata (ChromaDB ID is now row_X)
-        actual_course_id = results['metadatas'][0][i].get('course_id', '')
-        
-        # Get vector similarity score (ChromaDB returns distances, convert to similarity)
-        vector_score = 1.0 - results['distances'][0][i]  # Cosine distance -> similarity
-        
-        # Get keyword score using actual course_id
-        kw_score = keyword_score(query, actual_course_id)
-        
-        # Hybrid score
-        final_score = (vector_score * VECTOR_WEIGHT) + (kw_score * KEYWORD_WEIGHT)
-        
-        # Get full course data using actual course_id
-        course = COURSES_BY_ID.get(actual_course_id)
-        if not course:
-            continue
+    Branch and bound over candidates sorted by score: a branch is cut as soon
+    as even its best possible completion can't beat the worst kept plan.
+    Returns: ([(total score, [(score, course), ...]), ...] best first, search completed)
+    """
+    items = []
+    seen = set()
+    for score, course in sorted(candidates, key=lambda x: x[0], reverse=True):
+        cid = str(course.get("course_id", ""))
+        mask = COURSE_SLOT_MASKS.get(cid, 0)
+        if mask and cid not in seen:
+            seen.add(cid)
+            items.append((score, course, mask))
+    
+    scores = [score for score, _, _ in items]
+    masks = [mask for _, _, mask in items]
+    prefix_sums = [0.0]
+    for score in scores:
+        prefix_sums.append(prefix_sums[-1] + score)
+    
+    best: List[Tuple[float, Tuple[int, ...]]] = []  # Min-heap of kept plans
+    deadline = time.perf_counter() + time_budget
+    state = {"nodes": 0, "complete": True}
+    
+    def search(start: int, chosen: List[int], used: int, total: float) -> None:
+        if len(chosen) == n_courses:
+            if len(best) < n_plans:
+                heapq.heappush(best, (total, tuple(chosen)))
+            elif total > best[0][0]:
+                heapq.heapreplace(best, (total, tuple(chosen)))
+            return
         
-        # Apply schedule filtering
-        if user_schedule:
-            course_days = course.get("_days", [])
-            course_times = course.get("_times", [])
+        need = n_courses - len(chosen)
+        for i in range(start, len(items) - need + 1):
+            # Scores are sorted, so the next `need` items are the best case
+            bound = total + prefix_sums[i + need] - prefix_sums[i]
+            if len(best) == n_plans and bound <= best[0][0]:
+                return
+            if masks[i] & used:
+                continue
             
-            if not course_days or not course_times:
-                continue  # Skip TBA courses if user has schedule preference
+            state["nodes"] += 1
+            if state["nodes"] % 1024 == 0 and time.perf_counter() > deadline:
+                state["complete"] = False
+            if not state["complete"]:
+                return
             
-            is_compatible = True
-            for day in course_days:
-                if day not in user_schedule:
-                    is_compatible = False
-                    break
-                
-                user_times = user_schedule[day]
-                for t in course_times:
-                    if t not in user_times:
-                        is_compatible = False
-                        break
-                if not is_compatible:
-                    break
-            
-            if not is_compatible:
+            chosen.append(i)
+            search(i + 1, chosen, used | masks[i], total + scores[i])
+            chosen.pop()
+    
+    if n_courses > 0:
+        search(0, [], 0, 0.0)
+    
+    plans = [
+        (total, [(scores[i], items[i][1]) for i in chosen])
+        for total, chosen in sorted(best, reverse=True)
+    ]
+    return plans, state["complete"]
+
+
+# ---------------------------------------------------------------------
+# Offline Batch Matching (CLI)
+# ---------------------------------------------------------------------
+
+# Matrix row -> course_id, set once per pool worker by init_batch_worker()
+BATCH_ROW_COURSE_IDS: List[str] = []
+
+
+def profile_error(profile_id: Any, message: str) -> Dict[str, Any]:
+    """Placeholder for an input profile that can't be matched."""
+    print(f"⚠️  Skipping profile {profile_id}: {message}", file=sys.stderr)
+    return {"id": profile_id, "error": message}
+
+
+def iter_profiles(input_path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Stream match profiles from a CSV or JSONL file.
+    
+    JSONL lines use the /api/courses/match request body. CSV columns are
+    goal, skills (comma-separated), resume and schedule (JSON list).
+    An optional "id" field/column is echoed back in the output. Rows that
+    can't be parsed are yielded as {"id": ..., "error": ...}.
+    """
+    with open(input_path, "r", encoding="utf-8") as f:
+        if input_path.suffix.lower() == ".csv":
+            for line_no, row in enumerate(csv.DictReader(f), start=1):
+                profile_id = row.get("id") or str(line_no)
+                try:
+                    schedule = json.loads(row.get("schedule") or "[]")
+                except json.JSONDecodeError as e:
+                    yield profile_error(profile_id, f"Invalid schedule JSON: {e}")
+                    continue
+                if not isinstance(schedule, list):
+                    yield profile_error(profile_id, "schedule must be a JSON list")
+                    continue
+                yield {
+                    "id": profile_id,
+                    "goal": row.get("goal", ""),
+                    "skills": [s.strip() for s in (row.get("skills") or "").split(",") if s.strip()],
+                    "resume": row.get("resume", ""),
+                    "schedule": schedule,
+                }
+        else:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    profile = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield profile_error(str(line_no), f"Invalid JSON: {e}")
+                    continue
+                if not isinstance(profile, dict):
+                    yield profile_error(str(line_no), "Profile must be a JSON object")
+                    continue
+                profile.setdefault("id", str(line_no))
+                if not isinstance(profile.get("schedule", []), list):
+                    yield profile_error(profile["id"], "schedule must be a list")
+                    continue
+                yield profile
+
+
+def load_course_embeddings() -> Tuple[List[str], np.ndarray]:
+    """Pull all course embeddings from ChromaDB as a unit-normalized matrix."""
+    data = course_collection.get(include=["embeddings", "metadatas"])
+    row_course_ids = [m.get("course_id", "") for m in data["metadatas"]]
+    
+    matrix = np.asarray(data["embeddings"], dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix /= np.where(norms == 0, 1.0, norms)
+    
+    return row_course_ids, matrix
+
+
+def init_batch_worker(row_course_ids: List[str]) -> None:
+    """Pool initializer: receive the matrix row -> course_id map once per worker."""
+    global BATCH_ROW_COURSE_IDS
+    BATCH_ROW_COURSE_IDS = row_course_ids
+
+
+def rank_batch_profile(task: Tuple[Any, str, List[Dict[str, Any]], List[Tuple[int, float]], int]) -> str:
+    """Pool worker: rerank and schedule-filter one profile, return its JSONL line."""
+    profile_id, query, schedule, candidate_rows, top_k = task
+    
+    try:
+        candidates = [(BATCH_ROW_COURSE_IDS[row], score) for row, score in candidate_rows]
+        results = rank_candidates(query, candidates, parse_user_schedule(schedule), top_k)
+    except Exception as e:
+        return json.dumps(profile_error(profile_id, f"Matching failed: {e}"), ensure_ascii=False)
+    
+    return json.dumps({
+        "id": profile_id,
+        "query": query,
+        "courses": [
+            {
+                "course_id": course.get("course_id", ""),
+                "course_name": course.get("course_name", ""),
+                "match_percent": match_percent_for(score),
+                "meetingTime": course.get("_meetingTime", ""),
+            }
+            for score, course in results
+        ],
+    }, ensure_ascii=False)
+
+
+def embed_profile_batch(batch: List[Dict[str, Any]], matrix: np.ndarray,
+                        top_k: int) -> Iterator[Tuple[Any, str, List[Dict[str, Any]], List[Tuple[int, float]], int]]:
+    """
+    Embed a batch of profiles and pick their vector candidates with one
+    matrix product. Yields rank_batch_profile() tasks.
+    """
+    queries = [build_match_query(p) or "general course" for p in batch]
+    embeddings = embedding_model.encode(
+        queries, batch_size=len(batch), normalize_embeddings=True, convert_to_numpy=True
+    ).astype(np.float32)
+    
+    # Cosine similarity (rows are unit vectors), then the top candidates per profile
+    similarities = embeddings @ matrix.T
+    n_candidates = min(VECTOR_CANDIDATES, matrix.shape[0])
+    top_rows = np.argpartition(-similarities, n_candidates - 1, axis=1)[:, :n_candidates]
+    top_scores = np.take_along_axis(similarities, top_rows, axis=1)
+    
+    for profile, query, rows, scores in zip(batch, queries, top_rows, top_scores):
+        candidate_rows = list(zip(rows.tolist(), scores.tolist()))
+        yield profile["id"], query, profile.get("schedule", []), candidate_rows, top_k
+
+
+def write_profile_batch(pool, out, batch: List[Dict[str, Any]], matrix: np.ndarray,
+                        top_k: int, chunksize: int) -> None:
+    """Match one batch and write its lines in input order, errors included."""
+    valid = [p for p in batch if "error" not in p]
+    lines = iter(())
+    if valid:
+        tasks = embed_profile_batch(valid, matrix, top_k)
+        lines = pool.imap(rank_batch_profile, tasks, chunksize=chunksize)
+    
+    for profile in batch:
+        if "error" in profile:
+            out.write(json.dumps(profile, ensure_ascii=False) + "\n")
+        else:
+            out.write(next(lines) + "\n")
+
+
+def batch_match(input_path: Path, output_path: Path, workers: Optional[int] = None,
+                batch_size: int = 256, top_k: int = 20) -> int:
+    """
+    Match every profile in input_path and write one JSON line per profile.
+    
+    Profiles are streamed in and embedded batch_size at a time; reranking and
+    schedule filtering run in a process pool. Memory stays bounded by the
+    batch size, not the input size. Profiles that fail get an "error" line
+    instead of stopping the run. Returns the number of profiles written.
+    """
+    row_course_ids, matrix = load_course_embeddings()
+    pool_size = workers or os.cpu_count() or 1
+    chunksize = max(1, batch_size // (4 * pool_size))
+    written = 0
+    
+    with multiprocessing.Pool(pool_size, initializer=init_batch_worker, initargs=(row_course_ids,)) as pool, \
+            open(output_path, "w", encoding="utf-8") as out:
+        batch = []
+        for profile in iter_profiles(input_path):
+            batch.append(profile)
+            if len(batch) < batch_size:
                 continue
+            
+            write_profile_batch(pool, out, batch, matrix, top_k, chunksize)
+            written += len(batch)
+            batch = []
+            print(f"… matched {written} profiles", file=sys.stderr)
         
-        scored_courses.append((final_score, course))
+        if batch:
+            write_profile_batch(pool, out, batch, matrix, top_k, chunksize)
+            written += len(batch)
     
-    # Sort by hybrid score
-    scored_courses.sort(key=lambda x: x[0], reverse=True)
-    
-    return scored_courses[:top_k]
+    print(f"✓ Wrote {written} profile matches to {output_path}", file=sys.stderr)
+    return written
 
 
 # ---------------------------------------------------------------------
@@ -505,6 +1211,40 @@ def hybrid_search(query: str, user_schedule: Dict[str, set], top_k: int = 20) ->
 # ---------------------------------------------------------------------
 
 def generate_course_summary(course: Dict[str, Any], user_profile: Dict[str, Any]) -> str:
+    """
+    Generate personalized course summary, coalescing identical concurrent
+    requests into one Groq completion (see run_course_summary).
+    """
+    try:
+        key = summary_flight_key(course, user_profile)
+    except Exception:
+        # Malformed payload: skip coalescing and let the fallback handle it
+        return run_course_summary(course, user_profile)
+    
+    return SUMMARY_FLIGHTS.do(key, run_course_summary, course, user_profile)
+
+
+def summary_flight_key(course: Dict[str, Any], user_profile: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Coalescing key for a summary request: course text + normalized profile."""
+    if not isinstance(user_profile, dict):
+        user_profile = {}
+    
+    skills = user_profile.get("skills") or []
+    if isinstance(skills, (list, tuple)):
+        skills_key = tuple(normalize_text(s) for s in skills)
+    else:
+        skills_key = normalize_text(skills)
+    
+    return (
+        normalize_text(course.get("course_id")),
+        normalize_text(course.get("course_name")),
+        normalize_text(course.get("description_clean") or course.get("description")),
+        normalize_text(user_profile.get("career_goals")),
+        skills_key,
+    )
+
+
+def run_course_summary(course: Dict[str, Any], user_profile: Dict[str, Any]) -> str:
     """Generate personalized course summary using Groq."""
     if not groq_client:
         # Fallback to description
@@ -616,6 +1356,88 @@ Respond with ONLY a JSON object in this exact format:
         return {"Audit Status": "Pass", "Reason": "Fallback validation"}
 
 
+# ---------------------------------------------------------------------
+# Request Profiling (opt-in)
+# ---------------------------------------------------------------------
+
+# One profile at a time: cProfile hooks can't be stacked on Python 3.12+
+profile_lock = threading.Lock()
+
+
+def profile_token_ok(token: str) -> bool:
+    """Check a profiling trigger/admin token against PROFILE_ADMIN_TOKEN."""
+    if not PROFILE_ADMIN_TOKEN or not token:
+        return False
+    return hmac.compare_digest(token.encode("utf-8"), PROFILE_ADMIN_TOKEN.encode("utf-8"))
+
+
+def list_profiles() -> List[Path]:
+    """Saved profiles, newest first."""
+    if not PROFILE_DIR.exists():
+        return []
+    return sorted(PROFILE_DIR.glob("*.prof"), reverse=True)  # Names start with a timestamp
+
+
+def save_profile(profiler: cProfile.Profile, endpoint: str, elapsed_ms: float) -> Optional[str]:
+    """
+    Dump a profile into the ring buffer directory, dropping the oldest ones.
+    Returns the file name, or None if it couldn't be written.
+    """
+    # One UTC clock reading, so names sort in creation order
+    seconds, nanos = divmod(time.time_ns(), 10**9)
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(seconds))
+    name = f"{stamp}Z-{nanos:09d}-{endpoint}-{int(elapsed_ms)}ms.prof"
+    
+    try:
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(PROFILE_DIR / name))
+    except OSError as e:
+        print(f"✗ Could not save profile {name}: {e}")
+        return None
+    
+    # Never rotate out the profile just written
+    others = [p for p in list_profiles() if p.name != name]
+    for old in others[max(PROFILE_MAX_FILES - 1, 0):]:
+        try:
+            old.unlink()
+        except OSError:
+            pass
+    return name
+
+
+def profiled(view):
+    """
+    Profile a route with cProfile when PROFILING_ENABLED is set and the
+    request carries an X-Profile header equal to PROFILE_ADMIN_TOKEN.
+    The dump is a standard .prof file (snakeviz, flameprof, gprof2dot) and
+    its name is returned in the X-Profile-Id response header.
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if not PROFILING_ENABLED or "X-Profile" not in request.headers:
+            return view(*args, **kwargs)
+        if not profile_token_ok(request.headers["X-Profile"]) or not profile_lock.acquire(blocking=False):
+            return view(*args, **kwargs)
+        
+        try:
+            profiler = cProfile.Profile()
+            started = time.perf_counter()
+            profiler.enable()
+            try:
+                response = app.make_response(view(*args, **kwargs))
+            finally:
+                profiler.disable()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            name = save_profile(profiler, view.__name__, elapsed_ms)
+            if name:
+                response.headers["X-Profile-Id"] = name
+            return response
+        finally:
+            profile_lock.release()
+    
+    return wrapper
+
+
 # ---------------------------------------------------------------------
 # API Routes
 # ---------------------------------------------------------------------
@@ -627,11 +1449,16 @@ def health() -> Any:
         "status": "ok",
         "courses_count": len(COURSES),
         "vector_db_count": course_collection.count() if course_collection else 0,
-        "groq_enabled": groq_client is not None
+        "groq_enabled": groq_client is not None,
+        "coalescing": {
+            "search": SEARCH_FLIGHTS.stats(),
+            "summary": SUMMARY_FLIGHTS.stats()
+        }
     })
 
 
 @app.route("/api/courses/match", methods=["POST"])
+@profiled
 def api_match_courses() -> Any:
     """
     Match courses using hybrid RAG search.
@@ -652,82 +1479,104 @@ def api_match_courses() -> Any:
     except Exception as e:
         return jsonify({"error": f"Invalid JSON: {e}"}), 400
     
-    goal = payload.get("goal", "")
-    skills = payload.get("skills", [])
-    resume = payload.get("resume", "")
+    query = build_match_query(payload)
+    user_schedule_map = parse_user_schedule(payload.get("schedule", []))
     
-    # Build query
-    query_parts = [goal]
-    if isinstance(skills, list):
-        query_parts.extend(skills)
-    else:
-        query_parts.append(str(skills))
-    query_parts.append(resume)
+    # Perform hybrid search
+    results = hybrid_search(query, user_schedule_map, top_k=20)
     
-    query = " ".join(str(p) for p in query_parts if p).strip()
+    # Build response from pre-serialized course cards
+    return match_response(results, {
+        "query": query,
+        "total_courses": len(COURSES),
+        "vector_db_count": course_collection.count()
+    })
+
+
+@app.route("/api/courses/plan", methods=["POST"])
+@profiled
+def api_plan_courses() -> Any:
+    """
+    Plan sets of courses that fit the user's free time and don't overlap.
     
-    # Parse schedule
-    user_schedule_map = {}
-    for item in payload.get("schedule", []):
-        day = item.get("day")
-        times = item.get("times", [])
-        if day and times:
-            user_schedule_map[day] = set(times)
+    Request body: same as /api/courses/match, plus
+    {
+      "count": 4,   // courses per plan (max 8)
+      "plans": 5    // number of plans to return (max 20)
+    }
     
-    # Perform hybrid search
-    results = hybrid_search(query, user_schedule_map, top_k=20)
+    Plans reference courses by ID; each course card appears once in "courses".
+    """
+    try:
+        payload = request.get_json(force=True, silent=False) or {}
+    except Exception as e:
+        return jsonify({"error": f"Invalid JSON: {e}"}), 400
     
-    # Build response
-    courses_payload = []
-    for score, course in results:
-        cid = course.get("course_id", "")
-        name = course.get("course_name", "Untitled Course")
-        
-        rating = RATINGS_MAP.get(str(cid), 4.5)
-        match_percent = int(round(max(0.0, min(1.0, score)) * 100))
-        
-        avg_hours = WORKLOAD_HOURS_MAP.get(str(cid), 0)
-        if avg_hours == 0:
-            workload_label = "Unknown"
-        elif avg_hours <= 7:
-            workload_label = "Light Workload"
-        elif avg_hours <= 11:
-            workload_label = "Medium Workload"
-        else:
-            workload_label = "Heavy Workload"
-        
-        level = course.get("level", "unknown")
-        tags = course.get("tags", [])
-        summary = course.get("description_clean", "No description available.")
-        reviews = REVIEWS_MAP.get(str(cid), [])
+    try:
+        n_courses = int(payload.get("count", PLANNER_COURSES))
+        n_plans = int(payload.get("plans", PLANNER_PLANS))
+    except (TypeError, ValueError):
+        return jsonify({"error": "count and plans must be integers"}), 400
+    n_courses = max(1, min(n_courses, PLANNER_MAX_COURSES))
+    n_plans = max(1, min(n_plans, PLANNER_MAX_PLANS))
+    
+    query = build_match_query(payload)
+    user_schedule_map = parse_user_schedule(payload.get("schedule", []))
+    
+    # Candidates already fit the user's availability; the planner removes overlaps
+    candidates = hybrid_search(query, user_schedule_map, top_k=PLANNER_CANDIDATES)
+    plans, complete = plan_schedules(candidates, n_courses, n_plans)
+    
+    plans_payload = []
+    courses_payload = {}
+    for total, courses in plans:
+        course_ids = []
+        for score, course in courses:
+            cid = str(course.get("course_id", ""))
+            course_ids.append(cid)
+            if cid not in courses_payload:
+                courses_payload[cid] = course_card(course, match_percent_for(score))
         
-        courses_payload.append({
-            "course_id": cid,
-            "course_name": name,
-            "rating": rating,
-            "match_percent": match_percent,
-            "workload_label": workload_label,
-            "level": level,
-            "tags": tags[:10],
-            "ai_summary": summary,
-            "reviews": reviews,
-            "industry": course.get("industry", ""),
-            "meetingTime": course.get("_meetingTime", ""),
-            "days": course.get("_days", []),
-            "times": course.get("_times", []),
-            "raw": course,
+        plans_payload.append({
+            "course_ids": course_ids,
+            "match_percent": match_percent_for(total / len(courses)),
         })
     
     return jsonify({
+        "plans": plans_payload,
         "courses": courses_payload,
         "debug": {
             "query": query,
-            "total_courses": len(COURSES),
-            "vector_db_count": course_collection.count()
+            "candidates": len(candidates),
+            "complete": complete
         }
     })
 
 
+@app.route("/api/courses/autocomplete", methods=["GET"])
+def api_autocomplete_courses() -> Any:
+    """
+    Typeahead search over course IDs, titles and tags.
+    
+    Query params:
+      q      - text typed so far (e.g. "15-1", "machine le")
+      limit  - max results (default 10, capped at 50)
+    
+    Served from the in-memory prefix index; never touches the embedding model.
+    """
+    query = request.args.get("q", "")
+    try:
+        limit = int(request.args.get("limit", AUTOCOMPLETE_LIMIT))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    limit = max(1, min(limit, AUTOCOMPLETE_MAX_LIMIT))
+    
+    return jsonify({
+        "query": query,
+        "results": autocomplete_courses(query, limit)
+    })
+
+
 @app.route("/api/courses/summarize", methods=["POST"])
 def summarize_course() -> Any:
     """Generate personalized course summary using Groq."""
@@ -759,6 +1608,32 @@ def audit_review() -> Any:
         return jsonify({'Audit Status': "Fail", 'Reason': str(e)}), 500
 
 
+@app.route("/api/admin/profiles", methods=["GET"])
+def api_list_profiles() -> Any:
+    """List saved request profiles (newest first)."""
+    if not PROFILING_ENABLED or not profile_token_ok(request.headers.get("X-Admin-Token", "")):
+        return jsonify({"error": "Not found"}), 404
+    
+    profiles = []
+    for path in list_profiles():
+        stat = path.stat()
+        profiles.append({
+            "name": path.name,
+            "size": stat.st_size,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(stat.st_mtime)),
+        })
+    return jsonify({"profiles": profiles, "max_files": PROFILE_MAX_FILES})
+
+
+@app.route("/api/admin/profiles/<name>", methods=["GET"])
+def api_download_profile(name: str) -> Any:
+    """Download one saved profile (cProfile/pstats format)."""
+    if not PROFILING_ENABLED or not profile_token_ok(request.headers.get("X-Admin-Token", "")):
+        return jsonify({"error": "Not found"}), 404
+    
+    return send_from_directory(PROFILE_DIR, name, as_attachment=True)
+
+
 # ---------------------------------------------------------------------
 # Initialization & Entry Point
 # ---------------------------------------------------------------------
@@ -771,8 +1646,38 @@ def initialize():
     print("✅ Initialization complete!")
 
 
+def positive_int(value: str) -> int:
+    """argparse type for options that must be >= 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} is not an integer")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
+
 def main() -> None:
-    """Main entry point for Cloud Run."""
+    """Main entry point: API server for Cloud Run, or offline batch matching."""
+    parser = argparse.ArgumentParser(description="Course Pilot backend")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    batch_parser = subparsers.add_parser(
+        "batch-match", help="Match a CSV/JSONL file of profiles and write JSONL results"
+    )
+    batch_parser.add_argument("input", type=Path, help="Profiles (.csv or .jsonl)")
+    batch_parser.add_argument("output", type=Path, help="Output .jsonl path")
+    batch_parser.add_argument("--workers", type=positive_int, default=None, help="Pool size (default: CPU count)")
+    batch_parser.add_argument("--batch-size", type=positive_int, default=256, help="Profiles embedded per batch")
+    batch_parser.add_argument("--top-k", type=positive_int, default=20, help="Courses per profile")
+    
+    args = parser.parse_args()
+    
+    if args.command == "batch-match":
+        init_vector_db()
+        batch_match(args.input, args.output, args.workers, args.batch_size, args.top_k)
+        return
+    
     initialize()
     app.run(host="0.0.0.0", port=PORT, debug=False)
 